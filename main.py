@@ -1,5 +1,7 @@
 """FastAPI application for speaker diarization service using pyannoteAI."""
 
+import logging
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
@@ -10,6 +12,8 @@ from pydantic import BaseModel
 from config import get_settings
 from pyannote_client import get_pyannote_client
 
+logger = logging.getLogger(__name__)
+
 
 # Request/Response models
 class DiarizeRequest(BaseModel):
@@ -62,11 +66,28 @@ class HealthResponse(BaseModel):
     model: str
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure logging and create the pyannote client on startup; close it on shutdown."""
+    settings = get_settings()
+    logging.basicConfig(
+        level=settings.log_level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    # httpx/httpcore log every outbound request; keep them to warnings and errors
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    client = get_pyannote_client()
+    yield
+    await client.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Speaker Diarization Service",
     description="Audio diarization using pyannoteAI cloud API",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -147,11 +168,19 @@ async def identify(request: IdentifyRequest):
     client = get_pyannote_client()
 
     # Log voiceprint info for debugging
-    print(f"[/identify] Recording: {request.recording_id}")
-    print(f"[/identify] Audio URL: {request.audio_url}")
-    print(f"[/identify] Number of voiceprints: {len(request.voiceprints)}")
-    for vp in request.voiceprints:
-        print(f"[/identify] Voiceprint label: {vp.get('label')}, size: {len(vp.get('voiceprint', ''))} chars")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Recording: %s, audio URL: %s, %d voiceprints",
+            request.recording_id,
+            request.audio_url,
+            len(request.voiceprints),
+        )
+        for vp in request.voiceprints:
+            logger.debug(
+                "Voiceprint label: %s, size: %d chars",
+                vp.get("label"),
+                len(vp.get("voiceprint", "")),
+            )
 
     callback_url = request.callback_url or settings.webhook_url
     if "?" in callback_url:
@@ -1,10 +1,14 @@
 """Client for pyannoteAI cloud API."""
 
+import logging
+
 import httpx
 from typing import Any
 
 from config import get_settings
 
+logger = logging.getLogger(__name__)
+
 PYANNOTE_API_BASE = "https://api.pyannote.ai/v1"
 
 
@@ -17,6 +21,28 @@ class PyannoteClient:
             "Authorization": f"Bearer {self.settings.pyannote_api_key}",
             "Content-Type": "application/json",
         }
+        # Long-lived client so keep-alive connections are reused across calls
+        self._client = httpx.AsyncClient(
+            base_url=PYANNOTE_API_BASE,
+            headers=self.headers,
+            timeout=30.0,
+            # pyannoteAI rate-limits (429), so more sockets don't add throughput;
+            # keep every connection opened by a burst warm for follow-up /jobs polls
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=100,
+                keepalive_expiry=60,
+            ),
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying HTTP client has been closed."""
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
 
     async def submit_diarization(
         self,
@@ -54,15 +80,9 @@ class PyannoteClient:
         if max_speakers is not None:
             payload["maxSpeakers"] = max_speakers
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{PYANNOTE_API_BASE}/diarize",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post("/diarize", json=payload)
+        response.raise_for_status()
+        return response.json()
 
     async def submit_identification(
         self,
@@ -95,8 +115,6 @@ class PyannoteClient:
             "voiceprints": voiceprints,
         }
 
-        print(f"[pyannote_client] Voiceprints being sent: {[{'label': vp['label'], 'vp_len': len(vp['voiceprint'])} for vp in voiceprints]}")
-
         if webhook_url:
             payload["webhook"] = webhook_url
 
@@ -108,24 +126,22 @@ class PyannoteClient:
             payload["maxSpeakers"] = max_speakers
 
         # Log the payload being sent (mask the actual voiceprint data)
-        debug_payload = {**payload}
-        if "voiceprints" in debug_payload:
-            debug_payload["voiceprints"] = [
-                {"label": vp["label"], "voiceprint_length": len(vp.get("voiceprint", ""))}
-                for vp in payload["voiceprints"]
-            ]
-        print(f"[pyannote_client] Sending to /identify: {debug_payload}")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{PYANNOTE_API_BASE}/identify",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0,
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sending to /identify: %r",
+                {
+                    **payload,
+                    "voiceprints": [
+                        {"label": vp["label"], "voiceprint_length": len(vp.get("voiceprint", ""))}
+                        for vp in voiceprints
+                    ],
+                },
             )
-            print(f"[pyannote_client] Response status: {response.status_code}")
-            response.raise_for_status()
-            return response.json()
+
+        response = await self._client.post("/identify", json=payload)
+        logger.debug("/identify response status: %s", response.status_code)
+        response.raise_for_status()
+        return response.json()
 
     async def get_job(self, job_id: str) -> dict[str, Any]:
         """
@@ -137,14 +153,9 @@ class PyannoteClient:
         Returns:
             Job details including status and output (if complete)
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{PYANNOTE_API_BASE}/jobs/{job_id}",
-                headers=self.headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(f"/jobs/{job_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def create_voiceprint(
         self,
@@ -169,17 +180,11 @@ class PyannoteClient:
         if webhook_url:
             payload["webhook"] = webhook_url
 
-        print(f"[pyannote_client] Creating voiceprint with model: {self.settings.pyannote_model}")
+        logger.debug("Creating voiceprint with model: %s", self.settings.pyannote_model)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{PYANNOTE_API_BASE}/voiceprint",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post("/voiceprint", json=payload)
+        response.raise_for_status()
+        return response.json()
 
 
 # Global client instance
@@ -189,6 +194,6 @@ _client: PyannoteClient | None = None
 def get_pyannote_client() -> PyannoteClient:
     """Get the global pyannote client instance."""
     global _client
-    if _client is None:
+    if _client is None or _client.is_closed:
         _client = PyannoteClient()
     return _client